@@ -12,11 +12,30 @@ def generate_string(base, indices):
     """
     Iteratively inserts the string into itself after given indices.
     Each step doubles the string length, matching the project specification.
+
+    The final length is known up front (len(base) * 2**len(indices)), so the
+    string is built in a single preallocated buffer: each step shifts the tail
+    right and copies the current prefix into the gap, instead of allocating
+    three new strings per insertion. The buffer holds one byte per character,
+    so non-ASCII bases (e.g. a UTF-8 BOM left on the first line) take the
+    plain slicing loop instead.
     """
-    s = base
+    if not base.isascii():
+        s = base
+        for idx in indices:
+            s = s[:idx + 1] + s + s[idx + 1:]
+        return s
+
+    length = len(base)
+    buf = bytearray(length << len(indices))
+    buf[:length] = base.encode('ascii')
     for idx in indices:
-        s = s[:idx + 1] + s + s[idx + 1:]
-    return s
+        # Same clamping as the slice s[:idx + 1], including negative idx
+        cut = len(range(length)[:idx + 1])
+        buf[cut + length:2 * length] = buf[cut:length]
+        buf[cut:cut + length] = buf[:length]
+        length *= 2
+    return buf.decode('ascii')
 
 
 def parse_input_file(input_path):
@@ -30,22 +49,18 @@ def parse_input_file(input_path):
     Uses Format 2 (Implicit lists): s0, indices..., t0, indices...
     This is the standard format used by the test cases.
     """
+    # Splitting on whitespace drops blank lines and surrounding spaces in one
+    # C-level pass.
     with open(input_path, 'r') as f:
-        lines = [line.strip() for line in f if line.strip()]
+        lines = f.read().split()
 
     if not lines:
         return "", [], "", []
 
     def is_int(s):
-        try:
-            int(s)
-            return True
-        except ValueError:
-            return False
-
-    def is_dna_base_string(s):
-        """Check if string contains only valid DNA bases (A, C, G, T)"""
-        return len(s) > 0 and all(c in 'ACGT' for c in s.upper())
+        # Indices are decimal integers with an optional sign; a DNA base
+        # string never is one.
+        return (s[1:] if s[:1] in ('+', '-') else s).isdecimal()
 
     try:
         # Format 2: Implicit lists (s0, indices..., t0, indices...)
@@ -54,7 +69,7 @@ def parse_input_file(input_path):
         idx = 1
         
         # Collect all integer indices for first string
-        while idx < len(lines) and is_int(lines[idx]) and not is_dna_base_string(lines[idx]):
+        while idx < len(lines) and is_int(lines[idx]):
             s_indices.append(int(lines[idx]))
             idx += 1
             
@@ -65,7 +80,7 @@ def parse_input_file(input_path):
             t_indices = []
             
             # Collect all integer indices for second string
-            while idx < len(lines) and is_int(lines[idx]) and not is_dna_base_string(lines[idx]):
+            while idx < len(lines) and is_int(lines[idx]):
                 t_indices.append(int(lines[idx]))
                 idx += 1
                 
@@ -114,7 +129,67 @@ def get_alpha(char1, char2):
     return ALPHA.get(char1, {}).get(char2, 0)
 
 
+# Integer-encoded view of ALPHA: nucleotides map to 0..3 in the order below,
+# so the DP loops index a small list-of-lists instead of nested dicts. Any
+# other character maps to UNKNOWN_CODE, whose row and column cost 0, the same
+# fallback get_alpha applies to characters missing from ALPHA.
+BASES = 'ACGT'
+UNKNOWN_CODE = len(BASES)
+ALPHA_MATRIX = ([[ALPHA[a][b] for b in BASES] + [0] for a in BASES]
+                + [[0] * (len(BASES) + 1)])
+_ENCODE_TABLE = bytes(BASES.index(chr(c)) if chr(c) in BASES else UNKNOWN_CODE
+                      for c in range(256))
+
+
+# Traceback moves recorded by dp_alignment
+MATCH = 0
+GAP_IN_STR2 = 1
+GAP_IN_STR1 = 2
+
+
+def encode_sequence(s):
+    """Encode a DNA string as bytes of base codes (A=0, C=1, G=2, T=3, other=4)."""
+    # Non-ASCII characters become '?' and so fall into UNKNOWN_CODE as well
+    return s.encode('ascii', 'replace').translate(_ENCODE_TABLE)
+
+
+def contained_alignment(str1, str2, gap=GAP):
+    """
+    Align str1 and str2 directly when one contains the other.
+
+    Every alignment needs at least |len(str1) - len(str2)| gaps, and when the
+    shorter string occurs in the longer one, padding it with gaps around that
+    occurrence achieves exactly that cost. Equal strings are the zero-gap case.
+    Returns (cost, aligned_str1, aligned_str2), or None if neither string
+    contains the other.
+    """
+    if len(str1) <= len(str2):
+        pos = str2.find(str1)
+        if pos < 0:
+            return None
+        aligned_str1 = '_' * pos + str1 + '_' * (len(str2) - len(str1) - pos)
+        return (len(str2) - len(str1)) * gap, aligned_str1, str2
+    pos = str1.find(str2)
+    if pos < 0:
+        return None
+    aligned_str2 = '_' * pos + str2 + '_' * (len(str1) - len(str2) - pos)
+    return (len(str1) - len(str2)) * gap, str1, aligned_str2
+
+
 def sequence_alignment(str1, str2, gap=GAP):
+    """
+    Compute the minimum alignment cost and an optimal alignment.
+
+    Returns (cost, aligned_str1, aligned_str2).
+    """
+    # Fast path: no DP needed when one string contains the other
+    contained = contained_alignment(str1, str2, gap)
+    if contained is not None:
+        return contained
+    return dp_alignment(str1, str2, gap)
+
+
+def dp_alignment(str1, str2, gap=GAP):
     """
     Compute the minimum alignment cost using dynamic programming.
     
@@ -123,51 +198,82 @@ def sequence_alignment(str1, str2, gap=GAP):
         OPT(i-1, j) + gap,          # gap in str2
         OPT(i, j-1) + gap           # gap in str1
     )
+
+    Returns (cost, aligned_str1, aligned_str2).
     """
     m = len(str1)
     n = len(str2)
     
-    # Initialize DP table
-    # dp[i][j] represents the minimum cost to align str1[0:i] with str2[0:j]
-    dp = [[0] * (n + 1) for _ in range(m + 1)]
-    
-    # Base cases: aligning empty strings
-    # dp[0][0] = 0 (already initialized)
+    codes1 = encode_sequence(str1)
+    codes2 = encode_sequence(str2)
+
+    # Query profile: profile[b][j-1] is the mismatch cost of base b against
+    # str2[j-1], so each row of the fill streams over precomputed costs.
+    profile = [[row[c] for c in codes2] for row in ALPHA_MATRIX]
+
+    # Only two rows of costs are kept. To recover the alignment, each cell
+    # records which option produced its minimum (one byte per cell) in
+    # moves[i][j-1]; ties prefer match, then gap in str2, then gap in str1.
+    # Base case row: aligning str1[0:0] against str2[0:j] costs j gaps
+    prev = [j * gap for j in range(n + 1)]
+    moves = [None]
+
+    # Fill the DP table one row at a time. The diagonal and vertical terms
+    # only read the previous row, so they are streamed with zip; only the
+    # horizontal term carries a dependency along the row. The three-way min
+    # is written as a compare ladder to avoid a builtin call per cell.
     for i in range(1, m + 1):
-        dp[i][0] = i * gap  # gap in str2
-    for j in range(1, n + 1):
-        dp[0][j] = j * gap  # gap in str1
-    
-    # Fill the DP table
-    for i in range(1, m + 1):
-        for j in range(1, n + 1):
+        left = i * gap  # base case: OPT(i, 0), gap in str2
+        curr = [left]
+        append = curr.append
+        row_moves = bytearray(n)
+        j = 0
+        for diag, alpha, up in zip(prev, profile[codes1[i-1]], prev[1:]):
             # Option 1: Match/mismatch str1[i-1] with str2[j-1]
-            match_cost = dp[i-1][j-1] + get_alpha(str1[i-1], str2[j-1])
-            
+            best = diag + alpha
+            move = MATCH
+
             # Option 2: Gap in str2 (skip str1[i-1])
-            gap_str2 = dp[i-1][j] + gap
-            
+            up += gap
+            if up < best:
+                best = up
+                move = GAP_IN_STR2
+
             # Option 3: Gap in str1 (skip str2[j-1])
-            gap_str1 = dp[i][j-1] + gap
-            
-            # Take the minimum
-            dp[i][j] = min(match_cost, gap_str2, gap_str1)
+            left += gap
+            if left < best:
+                move = GAP_IN_STR1
+            else:
+                left = best
+
+            append(left)
+            row_moves[j] = move
+            j += 1
+        moves.append(row_moves)
+        prev = curr
 
     aligned_str1 = []
     aligned_str2 = []
     i, j = m, n
 
     while i > 0 or j > 0:
-        if i > 0 and j > 0 and dp[i][j] == dp[i-1][j-1] + get_alpha(str1[i-1], str2[j-1]):
+        if i == 0:
+            move = GAP_IN_STR1
+        elif j == 0:
+            move = GAP_IN_STR2
+        else:
+            move = moves[i][j-1]
+
+        if move == MATCH:
             aligned_str1.append(str1[i-1])
             aligned_str2.append(str2[j-1])
             i -= 1
             j -= 1
-        elif i > 0 and dp[i][j] == dp[i-1][j] + gap:
+        elif move == GAP_IN_STR2:
             aligned_str1.append(str1[i-1])
             aligned_str2.append('_')
             i -= 1
-        else:  
+        else:
             aligned_str1.append('_')
             aligned_str2.append(str2[j-1])
             j -= 1
@@ -175,22 +281,23 @@ def sequence_alignment(str1, str2, gap=GAP):
     aligned_str1.reverse()
     aligned_str2.reverse()
     
-    return dp[m][n], ''.join(aligned_str1), ''.join(aligned_str2)
+    return prev[n], ''.join(aligned_str1), ''.join(aligned_str2)
 
 
 # ============================================================================
 # Memory-Efficient Alignment (Hirschberg's Algorithm)
 # ============================================================================
 
+# Created once so memory probes only read /proc, not set up a new handle
+_PROCESS = psutil.Process()
+
 def process_memory() -> int:
     """Return current process memory usage in KB."""
-    process = psutil.Process()
-    return int(process.memory_info().rss / 1024)
+    return int(_PROCESS.memory_info().rss / 1024)
 
 def get_memory_usage_kb():
     """Return memory usage in KB."""
-    process = psutil.Process()
-    return process.memory_info().rss // 1024
+    return _PROCESS.memory_info().rss // 1024
 
 def get_time_ms(start, end):
     """Return time difference in milliseconds."""
@@ -221,11 +328,7 @@ def main():
     memory_used = end_mem - start_mem
 
     with open(output_file, 'w') as f:
-        f.write(f"{alignment_cost}\n")
-        f.write(f"{aligned_X}\n")
-        f.write(f"{aligned_Y}\n")
-        f.write(f"{time_taken}\n")
-        f.write(f"{memory_used}\n")
+        f.write(f"{alignment_cost}\n{aligned_X}\n{aligned_Y}\n{time_taken}\n{memory_used}\n")
 
 
 if __name__ == "__main__":
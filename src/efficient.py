@@ -1,119 +1,135 @@
 import sys
 import os
 import time
-import psutil
+from operator import add
 from typing import Tuple, List
 
 # Import string generation functions from basic.py
-from basic import generate_string, parse_input_file, generate_input_strings, DELTA, GAP, ALPHA, get_alpha
-
-def process_memory():
-    """Return current process memory usage in KB as integer."""
-    process = psutil.Process()
-    return int(process.memory_info().rss / 1024)
+from basic import (generate_string, parse_input_file, generate_input_strings, DELTA, GAP, ALPHA,
+                   BASES, ALPHA_MATRIX, get_alpha, encode_sequence, contained_alignment,
+                   dp_alignment, process_memory)
 
 # =========================================================================
 # Memory-Efficient Alignment (Hirschberg's Algorithm)
 # =========================================================================
 
-def space_efficient_alignment(str1: str, str2: str) -> List[int]:
-    m, n = len(str1), len(str2)
-    prev = [j * DELTA for j in range(n + 1)]
-    for i in range(1, m + 1):
-        curr = [i * DELTA]
-        for j in range(1, n + 1):
-            match_cost = prev[j - 1] + get_alpha(str1[i - 1], str2[j - 1])
-            delete_cost = prev[j] + DELTA
-            insert_cost = curr[j - 1] + DELTA
-            curr.append(min(match_cost, delete_cost, insert_cost))
+def space_efficient_alignment(str1: str, str2: str, reverse: bool = False) -> List[int]:
+    """Return the last DP row aligning str1 with str2 (both read back to front if reverse)."""
+    return space_efficient_scores(encode_sequence(str1), encode_sequence(str2), reverse)
+
+def space_efficient_scores(codes1, codes2, reverse: bool = False) -> List[int]:
+    """space_efficient_alignment on sequences already encoded by encode_sequence.
+
+    codes1 and codes2 may be bytes or memoryview slices of a larger encoding.
+    """
+    n = len(codes2)
+    delta = DELTA
+    # Query profile: profile[b][j-1] is the mismatch cost of base b against
+    # the j-th base of str2 (counted from the end if reverse), so each row
+    # streams over precomputed costs. Reversal only changes the iteration
+    # order; no reversed copy of either sequence is built.
+    if reverse:
+        codes1 = reversed(codes1)
+        profile = [[row[c] for c in reversed(codes2)] for row in ALPHA_MATRIX]
+    else:
+        profile = [[row[c] for c in codes2] for row in ALPHA_MATRIX]
+    prev = [j * delta for j in range(n + 1)]
+    for i, code1 in enumerate(codes1, 1):
+        best = i * delta
+        curr = [best]
+        append = curr.append
+        # Three-way min as a compare ladder: no builtin call per cell
+        for diag, alpha, up in zip(prev, profile[code1], prev[1:]):
+            insert_cost = best + delta
+            best = diag + alpha
+            up += delta
+            if up < best:
+                best = up
+            if insert_cost < best:
+                best = insert_cost
+            append(best)
         prev = curr
     return prev
 
 def basic_alignment(str1: str, str2: str) -> Tuple[str, str, int]:
-    m, n = len(str1), len(str2)
-    dp = [[0] * (n + 1) for _ in range(m + 1)]
-    for i in range(m + 1):
-        dp[i][0] = i * DELTA
-    for j in range(n + 1):
-        dp[0][j] = j * DELTA
-    for i in range(1, m + 1):
-        for j in range(1, n + 1):
-            match_cost = dp[i-1][j-1] + get_alpha(str1[i-1], str2[j-1])
-            delete_cost = dp[i-1][j] + DELTA
-            insert_cost = dp[i][j-1] + DELTA
-            dp[i][j] = min(match_cost, delete_cost, insert_cost)
-    aligned_str1 = ""
-    aligned_str2 = ""
-    i, j = m, n
-    while i > 0 or j > 0:
-        if i == 0:
-            aligned_str1 = '_' + aligned_str1
-            aligned_str2 = str2[j-1] + aligned_str2
-            j -= 1
-        elif j == 0:
-            aligned_str1 = str1[i-1] + aligned_str1
-            aligned_str2 = '_' + aligned_str2
-            i -= 1
-        else:
-            current = dp[i][j]
-            match_cost = dp[i-1][j-1] + get_alpha(str1[i-1], str2[j-1])
-            delete_cost = dp[i-1][j] + DELTA
-            insert_cost = dp[i][j-1] + DELTA
-            if current == match_cost:
-                aligned_str1 = str1[i-1] + aligned_str1
-                aligned_str2 = str2[j-1] + aligned_str2
-                i -= 1
-                j -= 1
-            elif current == delete_cost:
-                aligned_str1 = str1[i-1] + aligned_str1
-                aligned_str2 = '_' + aligned_str2
-                i -= 1
-            else:
-                aligned_str1 = '_' + aligned_str1
-                aligned_str2 = str2[j-1] + aligned_str2
-                j -= 1
-    return aligned_str1, aligned_str2, dp[m][n]
+    # Full DP from basic.py: two cost rows plus one traceback byte per cell
+    cost, aligned_str1, aligned_str2 = dp_alignment(str1, str2, DELTA)
+    return aligned_str1, aligned_str2, cost
+
+def hirschberg_split(codes1_left, codes1_right, codes2) -> int:
+    """Return the first k minimising cost(left, codes2[:k]) + cost(right, codes2[k:]).
+
+    All arguments are encoded sequences (see space_efficient_scores).
+    """
+    score_left = space_efficient_scores(codes1_left, codes2)
+    # score_right[j] aligns codes1_right with the last j bases of codes2,
+    # so it is paired with score_left back to front rather than reversed
+    score_right = space_efficient_scores(codes1_right, codes2, reverse=True)
+    total_costs = list(map(add, score_left, reversed(score_right)))
+    return total_costs.index(min(total_costs))
 
 def hirschberg_alignment(str1: str, str2: str) -> Tuple[str, str, int]:
-    m, n = len(str1), len(str2)
-    if m == 0:
-        return '_' * n, str2, n * DELTA
-    if n == 0:
-        return str1, '_' * m, m * DELTA
-    if m == 1 or n == 1:
-        return basic_alignment(str1, str2)
-    mid = m // 2
-    str1_left = str1[:mid]
-    str1_right = str1[mid:]
-    score_left = space_efficient_alignment(str1_left, str2)
-    score_right = space_efficient_alignment(str1_right[::-1], str2[::-1])
-    score_right.reverse()
-    min_cost = float('inf')
-    split_idx = 0
-    for k in range(n + 1):
-        total_cost = score_left[k] + score_right[k]
-        if total_cost < min_cost:
-            min_cost = total_cost
-            split_idx = k
-    str2_left = str2[:split_idx]
-    str2_right = str2[split_idx:]
-    left_align_str1, left_align_str2, left_cost = hirschberg_alignment(str1_left, str2_left)
-    right_align_str1, right_align_str2, right_cost = hirschberg_alignment(str1_right, str2_right)
-    aligned_str1 = left_align_str1 + right_align_str1
-    aligned_str2 = left_align_str2 + right_align_str2
-    total_cost = left_cost + right_cost
-    return aligned_str1, aligned_str2, total_cost
+    # Subproblems are index ranges (lo1, hi1, lo2, hi2) on an explicit stack
+    # instead of recursive calls. The right half is pushed before the left so
+    # pieces come off in left-to-right order; the alignment strings are
+    # joined once at the end. Both strings are encoded once; the score passes
+    # read zero-copy memoryview slices of those encodings.
+    codes1 = memoryview(encode_sequence(str1))
+    codes2 = memoryview(encode_sequence(str2))
+    pieces1: List[str] = []
+    pieces2: List[str] = []
+    total_cost = 0
+    stack = [(0, len(str1), 0, len(str2))]
+    while stack:
+        lo1, hi1, lo2, hi2 = stack.pop()
+        m, n = hi1 - lo1, hi2 - lo2
+        if m == 0:
+            pieces1.append('_' * n)
+            pieces2.append(str2[lo2:hi2])
+            total_cost += n * DELTA
+            continue
+        if n == 0:
+            pieces1.append(str1[lo1:hi1])
+            pieces2.append('_' * m)
+            total_cost += m * DELTA
+            continue
+        if m == 1 or n == 1:
+            aligned_str1, aligned_str2, cost = basic_alignment(str1[lo1:hi1], str2[lo2:hi2])
+            pieces1.append(aligned_str1)
+            pieces2.append(aligned_str2)
+            total_cost += cost
+            continue
+        mid = lo1 + m // 2
+        split_idx = lo2 + hirschberg_split(codes1[lo1:mid], codes1[mid:hi1], codes2[lo2:hi2])
+        stack.append((mid, hi1, split_idx, hi2))
+        stack.append((lo1, mid, lo2, split_idx))
+    return ''.join(pieces1), ''.join(pieces2), total_cost
+
+class _ColumnCosts(dict):
+    """Cost of an aligned column (char1, char2).
+
+    The cost is DELTA if either side is the gap symbol '_', otherwise
+    get_alpha(char1, char2), which is 0 for characters outside ALPHA.
+    Columns over ACGT and '_' are precomputed; any other column is
+    computed on first use and cached.
+    """
+
+    def __missing__(self, column):
+        char1, char2 = column
+        cost = DELTA if char1 == '_' or char2 == '_' else get_alpha(char1, char2)
+        self[column] = cost
+        return cost
+
+COLUMN_COST = _ColumnCosts(
+    ((a, b), DELTA if '_' in (a, b) else ALPHA[a][b])
+    for a in BASES + '_'
+    for b in BASES + '_'
+)
 
 def calculate_alignment_cost(aligned_str1: str, aligned_str2: str) -> int:
     if len(aligned_str1) != len(aligned_str2):
         raise ValueError("Aligned sequences must have same length")
-    cost = 0
-    for i in range(len(aligned_str1)):
-        if aligned_str1[i] == '_' or aligned_str2[i] == '_':
-            cost += DELTA
-        else:
-            cost += get_alpha(aligned_str1[i], aligned_str2[i])
-    return cost
+    return sum(map(COLUMN_COST.__getitem__, zip(aligned_str1, aligned_str2)))
 
 # =========================================================================
 # Main Function for Efficient Algorithm
@@ -128,20 +144,25 @@ def main():
     # Measure memory and time
     mem_before = process_memory()
     start_time = time.time()
-    aligned_str1, aligned_str2, cost = hirschberg_alignment(str1, str2)
+    contained = contained_alignment(str1, str2, DELTA)
+    if contained is not None:
+        cost, aligned_str1, aligned_str2 = contained
+    else:
+        aligned_str1, aligned_str2, cost = hirschberg_alignment(str1, str2)
     end_time = time.time()
     mem_after = process_memory()
 
     time_taken = (end_time - start_time) * 1000
     memory_used = mem_after - mem_before
-    calculated_cost = calculate_alignment_cost(aligned_str1, aligned_str2)
 
+    # The aligner already returns the cost of the alignment it built;
+    # set VERIFY_ALIGNMENT=1 to recompute it from the aligned strings.
+    if os.environ.get("VERIFY_ALIGNMENT"):
+        calculated_cost = calculate_alignment_cost(aligned_str1, aligned_str2)
+        if calculated_cost != cost:
+            raise ValueError(f"Alignment cost mismatch: {calculated_cost} != {cost}")
 
     with open(output_file, 'w') as f:
-        f.write(f"{calculated_cost}\n")
-        f.write(f"{aligned_str1}\n")
-        f.write(f"{aligned_str2}\n")
-        f.write(f"{time_taken}\n")
-        f.write(f"{memory_used}\n")
+        f.write(f"{cost}\n{aligned_str1}\n{aligned_str2}\n{time_taken}\n{memory_used}\n")
 if __name__ == "__main__":
     main()
@@ -4,11 +4,30 @@ def generate_string(base, indices):
     """
     Iteratively inserts the string into itself after given indices.
     Each step doubles the string length, matching the project specification.
+
+    The final length is known up front (len(base) * 2**len(indices)), so the
+    string is built in a single preallocated buffer: each step shifts the tail
+    right and copies the current prefix into the gap, instead of allocating
+    three new strings per insertion. The buffer holds one byte per character,
+    so non-ASCII bases (e.g. a UTF-8 BOM left on the first line) take the
+    plain slicing loop instead.
     """
-    s = base
+    if not base.isascii():
+        s = base
+        for idx in indices:
+            s = s[:idx + 1] + s + s[idx + 1:]
+        return s
+
+    length = len(base)
+    buf = bytearray(length << len(indices))
+    buf[:length] = base.encode('ascii')
     for idx in indices:
-        s = s[:idx + 1] + s + s[idx + 1:]
-    return s
+        # Same clamping as the slice s[:idx + 1], including negative idx
+        cut = len(range(length)[:idx + 1])
+        buf[cut + length:2 * length] = buf[cut:length]
+        buf[cut:cut + length] = buf[:length]
+        length *= 2
+    return buf.decode('ascii')
 
 
 def parse_input_file(input_path):
@@ -23,66 +42,52 @@ def parse_input_file(input_path):
     1. Explicit counts (s0, j, indices..., t0, k, indices...)
     2. Implicit lists (s0, indices..., t0, indices...)
     """
+    # Splitting on whitespace drops blank lines and surrounding spaces in one
+    # C-level pass.
     with open(input_path, 'r') as f:
-        lines = [line.strip() for line in f if line.strip()]
+        lines = f.read().split()
 
     if not lines:
         return "", [], "", []
 
     def is_int(s):
-        try:
-            int(s)
-            return True
-        except ValueError:
-            return False
-
-    # Try Format 1: Explicit counts
-    try:
-        s0 = lines[0]
-        j = int(lines[1])
-        
-        # Check if file has enough lines for this format
-        # We need at least: 1 (s0) + 1 (j) + j (indices) + 1 (t0) + 1 (k)
-        if len(lines) < 2 + j + 2:
-            raise IndexError("File too short for Format 1")
-
-        t0_line_index = 2 + j
-        t0 = lines[t0_line_index]
-        k = int(lines[t0_line_index + 1])
-        
-        # Verify we have enough lines for t_indices
-        if len(lines) < t0_line_index + 2 + k:
-             raise IndexError("File too short for Format 1 t_indices")
-
-        s_indices = [int(lines[2 + i]) for i in range(j)]
-        t_indices = [int(lines[t0_line_index + 2 + i]) for i in range(k)]
-
-        return s0, s_indices, t0, t_indices
-    except (ValueError, IndexError):
-        # Fallback to Format 2
-        pass
+        return (s[1:] if s[:1] in ('+', '-') else s).isdecimal()
+
+    # Classify every token once; both formats are then checked by index
+    # arithmetic on these flags instead of parse-and-retry.
+    int_flags = [is_int(line) for line in lines]
+
+    # Format 1: Explicit counts
+    # We need at least: 1 (s0) + 1 (j) + j (indices) + 1 (t0) + 1 (k) + k (indices)
+    if len(lines) > 1 and int_flags[1] and int(lines[1]) >= 0:
+        t0_line_index = 2 + int(lines[1])
+        k_line_index = t0_line_index + 1
+        if (k_line_index < len(lines) and int_flags[k_line_index]
+                and all(int_flags[2:t0_line_index])):
+            k = int(lines[k_line_index])
+            t_end = k_line_index + 1 + k
+            if k >= 0 and t_end <= len(lines) and all(int_flags[k_line_index + 1:t_end]):
+                s_indices = [int(line) for line in lines[2:t0_line_index]]
+                t_indices = [int(line) for line in lines[k_line_index + 1:t_end]]
+                return lines[0], s_indices, lines[t0_line_index], t_indices
 
     # Format 2: Implicit lists
-    try:
-        s0 = lines[0]
-        s_indices = []
-        idx = 1
-        while idx < len(lines) and is_int(lines[idx]):
-            s_indices.append(int(lines[idx]))
-            idx += 1
-            
-        if idx < len(lines):
-            t0 = lines[idx]
-            idx += 1
-            t_indices = []
-            while idx < len(lines) and is_int(lines[idx]):
-                t_indices.append(int(lines[idx]))
-                idx += 1
-            return s0, s_indices, t0, t_indices
-        else:
-            return s0, s_indices, "", []
-    except Exception as e:
-        raise ValueError(f"Failed to parse {input_path}: {e}")
+    s0 = lines[0]
+    idx = 1
+    while idx < len(lines) and int_flags[idx]:
+        idx += 1
+    s_indices = [int(line) for line in lines[1:idx]]
+
+    if idx >= len(lines):
+        return s0, s_indices, "", []
+
+    t0 = lines[idx]
+    idx += 1
+    t_start = idx
+    while idx < len(lines) and int_flags[idx]:
+        idx += 1
+    t_indices = [int(line) for line in lines[t_start:idx]]
+    return s0, s_indices, t0, t_indices
 
 
 def generate_input_strings(input_path):